@@ -0,0 +1,175 @@
+"""
+Convenience functions for loading COVID-19 data for many regions at once.
+
+Every loader returns a list of region names alongside (regions x days) numpy
+arrays sharing a single date axis, so that callers can operate on all regions
+with array operations instead of looping over regions in Python.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+NYT_STATES_CSV = './nyt-data/us-states.csv'
+NYT_COUNTIES_CSV = './nyt-data/us-counties.csv'
+COVIDTRACKING_STATES_CSV = './covidtracking-data/state-daily.csv'
+CA_CASES_URL = "https://data.ca.gov/dataset/590188d5-8545-4c93-" \
+        + "a9a0-e230f0db7290/resource/926fd08f-cc91-4828-af38-" \
+        + "bd45de97f8c3/download/statewide_cases.csv"
+
+
+def format_date(date):
+    """
+    Convert a 'YYYY-MM-DD' date string to the 'MM/DD' format used on plots.
+    """
+
+    return str(date)[5:7] + '/' + str(date)[8:10]
+
+
+def pivot_regions(csv_df, region_col, date_col, value_cols, iso_dates=False):
+    """
+    Pivot long-format data into one (regions x days) array per value column.
+
+    csv_df      - DataFrame with one row per (region, date)
+    region_col  - Name of the column identifying the region
+    date_col    - Name of the column holding the date
+    value_cols  - Names of the value columns to pivot
+    iso_dates   - Return 'YYYY-MM-DD' dates instead of 'MM/DD' dates
+
+    The columns cover every day from the first to the last date, including
+    days missing from the whole source. Days a region has not reported yet
+    are filled with 0 and later gaps are forward filled with the last
+    reported value.
+
+    Returns: (regions, dates, [array for each of value_cols])
+    """
+
+    if len(csv_df) == 0:
+        return [], np.array([], dtype=str), \
+            [np.zeros((0, 0), dtype=np.int64) for _ in value_cols]
+
+    csv_df = csv_df.assign(**{date_col: pd.to_datetime(csv_df[date_col].astype(str))
+                              .dt.strftime('%Y-%m-%d')})
+    dates = pd.date_range(csv_df[date_col].min(), csv_df[date_col].max())
+    dates = list(dates.strftime('%Y-%m-%d'))
+    regions = None
+    mats = []
+
+    for value_col in value_cols:
+        pivot_df = csv_df.pivot_table(index=region_col, columns=date_col,
+                                      values=value_col, aggfunc='max')
+        pivot_df = pivot_df.sort_index(axis=0).reindex(columns=dates)
+        pivot_df = pivot_df.ffill(axis=1).fillna(0)
+
+        if regions is None:
+            regions = list(pivot_df.index)
+        pivot_df = pivot_df.reindex(index=regions, fill_value=0)
+
+        mats.append(pivot_df.to_numpy(dtype=np.int64))
+
+    if iso_dates:
+        dates = np.array([str(date) for date in dates])
+    else:
+        dates = np.array([format_date(date) for date in dates])
+
+    return regions, dates, mats
+
+
+def load_nyt(level='state', iso_dates=False):
+    """
+    Load NYT cumulative cases and deaths for every state or every county.
+
+    level     - One of 'state' or 'county'
+    iso_dates - Return 'YYYY-MM-DD' dates instead of 'MM/DD' dates
+
+    Returns: (regions, dates, c_mat, d_mat)
+    regions - List of region names, one per row
+    dates   - Numpy array of 'MM/DD' dates, one per column
+    c_mat   - (regions x days) array of cumulative cases
+    d_mat   - (regions x days) array of cumulative deaths
+    """
+
+    if level == 'county':
+        csv_df = pd.read_csv(NYT_COUNTIES_CSV)
+        csv_df = csv_df.loc[csv_df['county'] != 'Unknown']
+        csv_df = csv_df.assign(region=csv_df['county'] + ' County, ' + csv_df['state'])
+    else:
+        csv_df = pd.read_csv(NYT_STATES_CSV)
+        csv_df = csv_df.assign(region=csv_df['state'])
+
+    regions, dates, (c_mat, d_mat) = pivot_regions(csv_df, 'region', 'date',
+                                                   ['cases', 'deaths'], iso_dates)
+
+    return regions, dates, c_mat, d_mat
+
+
+def load_covidtracking(iso_dates=False):
+    """
+    Load COVID Tracking Project cumulative cases and deaths and current
+    hospitalizations and ICU occupancy for every state.
+
+    iso_dates - Return 'YYYY-MM-DD' dates instead of 'MM/DD' dates
+
+    Returns: (regions, dates, c_mat, d_mat, h_mat, icu_mat)
+    regions - List of state abbreviations, one per row
+    dates   - Numpy array of 'MM/DD' dates, one per column
+    c_mat   - (regions x days) array of cumulative cases
+    d_mat   - (regions x days) array of cumulative deaths
+    h_mat   - (regions x days) array of people currently hospitalized
+    icu_mat - (regions x days) array of people currently in the ICU
+    """
+
+    csv_df = pd.read_csv(COVIDTRACKING_STATES_CSV)
+    date_strs = csv_df['date'].astype(str)
+    csv_df = csv_df.assign(date=date_strs.str[0:4] + '-' + date_strs.str[4:6]
+                           + '-' + date_strs.str[6:8])
+
+    regions, dates, (c_mat, d_mat, h_mat, icu_mat) = pivot_regions(
+        csv_df, 'state', 'date',
+        ['positive', 'death', 'hospitalizedCurrently', 'inIcuCurrently'], iso_dates)
+
+    return regions, dates, c_mat, d_mat, h_mat, icu_mat
+
+
+def load_ca(iso_dates=False):
+    """
+    Load data.ca.gov cumulative cases and deaths for every California county.
+
+    iso_dates - Return 'YYYY-MM-DD' dates instead of 'MM/DD' dates
+
+    Returns: (regions, dates, c_mat, d_mat)
+    regions - List of county names, one per row
+    dates   - Numpy array of 'MM/DD' dates, one per column
+    c_mat   - (regions x days) array of cumulative cases
+    d_mat   - (regions x days) array of cumulative deaths
+    """
+
+    csv_df = pd.read_csv(CA_CASES_URL)
+
+    regions, dates, (c_mat, d_mat) = pivot_regions(
+        csv_df, 'county', 'date', ['totalcountconfirmed', 'totalcountdeaths'], iso_dates)
+
+    return regions, dates, c_mat, d_mat
+
+
+def daily_counts(cum_mat):
+    """
+    Convert a (regions x days) array of cumulative counts into daily new
+    counts. The first day is counted from 0 and negative corrections are
+    clipped to 0.
+    """
+
+    return np.clip(np.diff(cum_mat, axis=1, prepend=0), 0, None)
+
+
+def window_sums(y_mat, window):
+    """
+    Sums of every full window of consecutive days along the last axis,
+    computed for all rows at once using cumulative sums. The result is
+    window-1 days shorter than y_mat; entry i covers days i to i+window-1.
+    """
+
+    csum = np.cumsum(np.asarray(y_mat, dtype=np.float64), axis=-1)
+    csum = np.concatenate((np.zeros_like(csum[..., :1]), csum), axis=-1)
+
+    return csum[..., window:] - csum[..., :-window]
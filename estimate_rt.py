@@ -0,0 +1,64 @@
+"""
+Batch script estimating the reproduction number (Rt) of every region of a
+data source for every day, written to a single CSV file.
+"""
+
+import argparse
+import numpy as np
+import pandas as pd
+
+from data_utils import load_nyt, load_covidtracking, load_ca, daily_counts
+from rt import estimate_rt
+
+
+def load_cases(source):
+    """ Load cumulative cases and 'YYYY-MM-DD' dates for every region of the given source. """
+
+    if source == 'nyt-states':
+        regions, dates, c_mat, _ = load_nyt('state', iso_dates=True)
+    elif source == 'nyt-counties':
+        regions, dates, c_mat, _ = load_nyt('county', iso_dates=True)
+    elif source == 'covidtracking':
+        regions, dates, c_mat, _, _, _ = load_covidtracking(iso_dates=True)
+    else:
+        regions, dates, c_mat, _ = load_ca(iso_dates=True)
+
+    return regions, dates, c_mat
+
+
+def estimate_rt_all(source, out_path):
+    """ Estimate Rt for every region and day of the given source. """
+
+    regions, dates, c_mat = load_cases(source)
+
+    if len(regions) == 0:
+        print("Could not find any entries for " + source + ".")
+        return
+
+    r_mean, r_low, r_high = estimate_rt(daily_counts(c_mat))
+
+    out_df = pd.DataFrame({
+        'region': np.repeat(np.array(regions, dtype=object), len(dates)),
+        'date': np.tile(dates, len(regions)),
+        'rt': r_mean.ravel(),
+        'rt_low': r_low.ravel(),
+        'rt_high': r_high.ravel(),
+    })
+    out_df.dropna(subset=['rt']).to_csv(out_path, index=False, float_format='%.4f')
+
+    print("Wrote Rt for " + str(len(regions)) + " regions to " + out_path + ".")
+
+
+def main():
+    """ Main function. """
+
+    parser = argparse.ArgumentParser(
+        description="Estimate COVID-19 Rt for every region of a data source")
+    parser.add_argument("source", choices=["nyt-states", "nyt-counties", "covidtracking", "ca"])
+    parser.add_argument("--output", default="rt.csv")
+    args = parser.parse_args()
+
+    estimate_rt_all(args.source, args.output)
+
+
+main()
@@ -0,0 +1,174 @@
+"""
+Export script writing the series behind the standard and hospitalization
+plots of every region in a compact form for client-side charting.
+
+Each region gets one file holding its series delta-encoded as int32 (the
+first value is relative to 0), so a client recovers the series with a
+cumulative sum and can recompute smoothing and derivatives itself. Trailing
+days without any change are left out of the file; clients pad the series
+with zero deltas up to the manifest's days. A manifest.json next to the
+region files records the date base, the series names and, per region, the
+number of stored days, the date of the last change and a content hash, so
+that clients only fetch regions whose hash changed since their last visit.
+
+Region files are named after their content hash, so files are never
+overwritten in place and a client reading an older manifest still finds the
+files it refers to. The manifest is replaced atomically once all region
+files are written, after which files only the previous manifest referred
+to are removed.
+
+Region file formats:
+    bin  - Raw little-endian int32, one series of the region's days after
+           another
+    json - Gzip compressed JSON object mapping series name to deltas
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import numpy as np
+
+from data_utils import load_nyt, load_covidtracking, load_ca
+
+
+MANIFEST_NAME = 'manifest.json'
+REGION_FILE_EXTENSIONS = {'bin': '.bin', 'json': '.json.gz'}
+
+
+def load_series(source):
+    """
+    Load every series of every region of the given source.
+
+    Returns: (regions, dates, series_names, (regions x series x days) array)
+    """
+
+    if source == 'nyt-states':
+        regions, dates, c_mat, d_mat = load_nyt('state', iso_dates=True)
+        names, mats = ['cases', 'deaths'], [c_mat, d_mat]
+    elif source == 'nyt-counties':
+        regions, dates, c_mat, d_mat = load_nyt('county', iso_dates=True)
+        names, mats = ['cases', 'deaths'], [c_mat, d_mat]
+    elif source == 'covidtracking':
+        regions, dates, c_mat, d_mat, h_mat, icu_mat = load_covidtracking(iso_dates=True)
+        names, mats = ['cases', 'deaths', 'hospitalized', 'icu'], [c_mat, d_mat, h_mat, icu_mat]
+    else:
+        regions, dates, c_mat, d_mat = load_ca(iso_dates=True)
+        names, mats = ['cases', 'deaths'], [c_mat, d_mat]
+
+    return regions, dates, names, np.stack(mats, axis=1)
+
+
+def delta_encode(series):
+    """
+    Delta encode along the last axis as int32, starting from 0.
+    """
+
+    return np.diff(series, axis=-1, prepend=0).astype('<i4')
+
+
+def stored_days(deltas):
+    """
+    Number of days of each region up to and including its last non-zero
+    delta in any series, for a (regions x series x days) array.
+    """
+
+    changed = np.any(deltas != 0, axis=1)
+    last = changed.shape[1] - np.argmax(changed[:, ::-1], axis=1)
+
+    return np.where(np.any(changed, axis=1), last, 0)
+
+
+def encode_region(names, deltas, fmt):
+    """ Serialize the delta-encoded series of one region. """
+
+    if fmt == 'bin':
+        return deltas.tobytes()
+
+    payload = json.dumps(dict(zip(names, deltas.tolist())), separators=(',', ':'))
+    # mtime=0 keeps the output, and therefore its hash, reproducible
+    return gzip.compress(payload.encode('utf-8'), mtime=0)
+
+
+def export_series(source, out_dir, fmt):
+    """ Export every region of the given source, rewriting changed regions only. """
+
+    regions, dates, names, series = load_series(source)
+
+    if len(regions) == 0:
+        print("Could not find any entries for " + source + ".")
+        return
+
+    os.makedirs(out_dir, exist_ok=True)
+    manifest_path = os.path.join(out_dir, MANIFEST_NAME)
+
+    old_files = set()
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as manifest_file:
+            old_manifest = json.load(manifest_file)
+        if old_manifest.get('source') == source:
+            old_files = {entry['file'] for entry in old_manifest['regions']}
+
+    deltas = delta_encode(series)
+    num_days = stored_days(deltas)
+
+    entries = []
+    num_changed = 0
+    for i, region in enumerate(regions):
+        data = encode_region(names, deltas[i, :, :num_days[i]], fmt)
+        sha1 = hashlib.sha1(data).hexdigest()
+        file_name = sha1 + REGION_FILE_EXTENSIONS[fmt]
+        file_path = os.path.join(out_dir, file_name)
+
+        if not os.path.exists(file_path):
+            with open(file_path, 'wb') as region_file:
+                region_file.write(data)
+        if file_name not in old_files:
+            num_changed += 1
+
+        entries.append({'name': region, 'file': file_name, 'sha1': sha1,
+                        'days': int(num_days[i]),
+                        'last_changed': str(dates[num_days[i] - 1]) if num_days[i] > 0 else None})
+
+    manifest = {
+        'source': source,
+        'format': fmt,
+        'encoding': 'delta',
+        'dtype': 'int32',
+        'byteorder': 'little',
+        'date_base': str(dates[0]),
+        'days': len(dates),
+        'series': names,
+        'regions': entries,
+    }
+    tmp_path = manifest_path + '.tmp'
+    with open(tmp_path, 'w') as manifest_file:
+        json.dump(manifest, manifest_file, separators=(',', ':'))
+    os.replace(tmp_path, manifest_path)
+
+    # Only remove files the previous manifest wrote and the new one dropped
+    for file_name in old_files - {entry['file'] for entry in entries}:
+        file_path = os.path.join(out_dir, file_name)
+        if os.path.exists(file_path):
+            os.remove(file_path)
+
+    print("Exported " + str(len(regions)) + " regions (" + str(num_changed)
+          + " changed) to " + out_dir + ".")
+
+
+def main():
+    """ Main function. """
+
+    parser = argparse.ArgumentParser(
+        description="Export compact COVID-19 series of every region of a data source")
+    parser.add_argument("source", choices=["nyt-states", "nyt-counties", "covidtracking", "ca"])
+    parser.add_argument("--format", choices=["bin", "json"], default="bin")
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+
+    out_dir = args.output if args.output is not None else os.path.join("export", args.source)
+    export_series(args.source, out_dir, args.format)
+
+
+main()
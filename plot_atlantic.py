@@ -9,7 +9,7 @@ import pandas as pd
 import numpy as np
 
 from plot_utils import standard_covid_plot, hospitalizations_plot, plot_bar, \
-        plot_line, plot_estimated_daily_infections
+        plot_line, plot_estimated_daily_infections, rt_plot
 
 mpl.rcParams['text.usetex'] = False
 
@@ -90,6 +90,8 @@ def plot_state_covidtracking(state):
     test_positivity = np.array(test_positivity, dtype=np.float32)
     plot_estimated_daily_infections(state, dates, test_positivity, d_cases)
 
+    rt_plot(state, dates, d_cases)
+
 
 def main():
     """ Main function. """
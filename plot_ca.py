@@ -10,7 +10,7 @@ import numpy as np
 import urllib
 
 from plot_utils import standard_covid_plot, hospitalizations_plot, \
-        plot_bar, plot_line, plot_estimated_daily_infections
+        plot_bar, plot_line, plot_estimated_daily_infections, rt_plot
 
 mpl.rcParams['text.usetex'] = False
 
@@ -128,6 +128,8 @@ def plot_ca(county):
     test_positivity = cases / tests
     plot_estimated_daily_infections(county, dates, np.array(test_positivity, dtype=np.float32), cases)
 
+    rt_plot(county, dates, cases)
+
 
 def main():
     """ Main function. """
@@ -6,8 +6,9 @@ import csv
 import argparse
 from matplotlib import pyplot as plt
 import matplotlib as mpl
+import numpy as np
 
-from plot_utils import standard_covid_plot
+from plot_utils import standard_covid_plot, rt_plot
 
 mpl.rcParams['text.usetex'] = False
 
@@ -43,6 +44,8 @@ def plot_state_nyt(state):
 
     standard_covid_plot("NYT COVID Data", state, dates, c_nums, d_nums)
 
+    rt_plot(state, dates, np.diff(c_nums, prepend=0))
+
 def plot_county_nyt(state, county):
     """ Plot NYT data for a given county. """
 
@@ -76,6 +79,8 @@ def plot_county_nyt(state, county):
 
     standard_covid_plot("NYT COVID Data", county + " County, " + state, dates, c_nums, d_nums)
 
+    rt_plot(county + " County, " + state, dates, np.diff(c_nums, prepend=0))
+
 def main():
     """ Main function. """
 
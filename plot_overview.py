@@ -0,0 +1,58 @@
+"""
+Overview script drawing a sparkline of smoothed daily NYT COVID-19 cases for
+every state or county into a single image.
+"""
+
+import argparse
+from matplotlib import pyplot as plt
+import matplotlib as mpl
+
+from data_utils import load_nyt, daily_counts
+from plot_utils import rolling_average, sparkline_grid_plot, \
+        SPARK_COLS, AVG_WINDOW
+
+mpl.rcParams['text.usetex'] = False
+
+
+def plot_overview_nyt(level, out_path, sort, ncols, labels=True):
+    """ Plot NYT smoothed daily cases for every state or county. """
+
+    regions, dates, c_mat, _ = load_nyt(level)
+
+    if len(regions) == 0:
+        print("Could not find any NYT entries.")
+        return
+
+    if len(dates) < AVG_WINDOW:
+        print("Could not find at least " + str(AVG_WINDOW) + " days of NYT entries.")
+        return
+
+    c_smooth = rolling_average(daily_counts(c_mat))
+    dates = dates[AVG_WINDOW//2:-(AVG_WINDOW//2)]
+
+    title = "NYT COVID Data - Daily Cases by " + level.title()
+    sparkline_grid_plot(title, regions if labels else None, dates, c_smooth, out_path,
+                        sort=sort, ncols=ncols)
+
+    print("Wrote " + str(len(regions)) + " regions to " + out_path + ".")
+
+
+def main():
+    """ Main function. """
+
+    parser = argparse.ArgumentParser(
+        description="Plot an overview of NYT COVID-19 data for every state or county")
+    parser.add_argument("--county", action="store_true")
+    parser.add_argument("--sort", choices=["growth", "name"], default="growth")
+    parser.add_argument("--cols", type=int, default=SPARK_COLS)
+    parser.add_argument("--output", default="overview.png")
+    parser.add_argument("--no-labels", action="store_true")
+    args = parser.parse_args()
+
+    plt.style.use("ggplot")
+
+    level = "county" if args.county else "state"
+    plot_overview_nyt(level, args.output, args.sort, args.cols, not args.no_labels)
+
+
+main()
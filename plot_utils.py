@@ -5,6 +5,10 @@ Convenience functions for graphing using matplotlib.
 import numpy as np
 from scipy.signal import savgol_filter
 from matplotlib import pyplot as plt
+from matplotlib.collections import LineCollection
+
+from data_utils import window_sums
+from rt import estimate_rt, RT_CI
 
 
 # Visual elements
@@ -24,6 +28,15 @@ AVG_WINDOW = 7
 # Default smoothing method
 DEFAULT_SMOOTHING = 'avg'
 
+# Sparkline grid parameters
+SPARK_COLS = 40
+SPARK_CELL_SIZE = (1.2, 0.45)
+SPARK_GAP = 0.15
+SPARK_LABEL_FONTSIZE = 3
+SPARK_GROWTH_DAYS = 7
+SPARK_GROWTH_PERCENTILE = 95
+SPARK_DPI = 150
+
 
 def plot_line(title, axis, x_vals, y_vals_set, line_labels,
               line_colors, xlabel, ylabel):
@@ -356,3 +369,190 @@ def plot_estimated_daily_infections(location, dates, test_positivity_series, cas
 
     fig.tight_layout()
     plt.show()
+
+
+def plot_rt(title, axis, x_vals, r_mean, r_low, r_high, xlabel, ylabel):
+    """
+    Plot reproduction number estimate with its credible interval.
+
+    title    - Title of graph
+    axis     - Axis object to graph on (plt subplot)
+    x_vals   - x coordinates of data points
+    r_mean   - Posterior mean of Rt per day
+    r_low    - Lower bound of the credible interval per day
+    r_high   - Upper bound of the credible interval per day
+    xlabel   - Label for x axis
+    ylabel   - Label for y axis
+
+    Returns: None
+    """
+
+    axis.set_title(title, fontsize=TITLE_FONTSIZE)
+    axis.set_xlabel(xlabel, fontsize=AXIS_LABEL_FONTSIZE)
+    axis.set_ylabel(ylabel, fontsize=AXIS_LABEL_FONTSIZE)
+
+    axis.fill_between(x_vals, r_low, r_high, color="lightcoral", alpha=0.4,
+                      label=str(int(RT_CI * 100)) + "% credible interval")
+    axis.plot(x_vals, r_mean, color="crimson", label="Rt")
+    axis.axhline(1., color="black", linewidth=0.8, linestyle="--")
+
+    axis.set_xticks(np.arange(0, len(x_vals), step=len(x_vals)/NUM_TICKS))
+    axis.legend(loc=2, fontsize=LEGEND_FONTSIZE)
+
+
+def rt_plot(location, dates, daily_cases):
+    """
+    Reproduction number graph.
+
+    location    - String indicating the location of the data (e.g. country or state or city)
+    dates       - List of dates of data (x-values of plot)
+    daily_cases - Numpy array of number of new cases (daily)
+
+    Returns: None
+    """
+
+    fig, axis = plt.subplots(nrows=1, ncols=1, figsize=(12, 8))
+    axis.tick_params(labelsize=8)
+
+    r_mean, r_low, r_high = estimate_rt(np.array(daily_cases, dtype=np.float64))
+
+    plot_rt(title=location + " COVID-19 Estimated Reproduction Number (Rt)",
+            axis=axis,
+            x_vals=dates,
+            r_mean=r_mean,
+            r_low=r_low,
+            r_high=r_high,
+            xlabel="date",
+            ylabel="Rt")
+
+    fig.tight_layout()
+    plt.show()
+
+
+def rolling_average(y_mat, window=AVG_WINDOW):
+    """
+    Rolling average along the last axis of a 1-D or 2-D array.
+
+    Matches the 'avg' smoothing of plot_bar, but computes every row at
+    once. The result is window-1 days shorter than
+    y_mat, i.e. centered on dates[window//2:-(window//2)].
+    """
+
+    return window_sums(y_mat, window) / float(window)
+
+
+def recent_growth(y_mat, days=SPARK_GROWTH_DAYS):
+    """
+    Log ratio between the last value of each row and the value the given
+    number of days earlier, or the first value for shorter rows. Positive
+    for growing rows, negative for shrinking rows.
+    """
+
+    days = min(days, y_mat.shape[-1] - 1)
+
+    return np.log1p(np.clip(y_mat[..., -1], 0, None)) \
+        - np.log1p(np.clip(y_mat[..., -1-days], 0, None))
+
+
+def draw_sparkline_labels(fig, axis, labels, ncols):
+    """
+    Draw the labels of a sparkline grid as one multi-line text per grid
+    column, with the line spacing scaled so consecutive lines are one cell
+    apart. Text line pitch is proportional to linespacing, so it is
+    measured once on probe texts.
+
+    fig    - Figure of the sparkline grid
+    axis   - Axis of the sparkline grid, with its limits already set
+    labels - Label for each cell, in grid order
+    ncols  - Number of sparklines per grid row
+
+    Returns: None
+    """
+
+    renderer = fig.canvas.get_renderer()
+    probes = [axis.text(0., 0., text, fontsize=SPARK_LABEL_FONTSIZE, linespacing=1.)
+              for text in ["A\nA", "A\nA\nA"]]
+    heights = [probe.get_window_extent(renderer=renderer).height for probe in probes]
+    for probe in probes:
+        probe.remove()
+
+    cell_pitch = np.diff(axis.transData.transform([(0., 0.), (0., 1. + SPARK_GAP)])[:, 1])[0]
+    linespacing = cell_pitch / (heights[1] - heights[0])
+
+    for col in range(min(ncols, len(labels))):
+        axis.text(col * (1. + SPARK_GAP), 1., "\n".join(labels[col::ncols]),
+                  fontsize=SPARK_LABEL_FONTSIZE, linespacing=linespacing,
+                  verticalalignment='top', clip_on=False)
+
+
+def sparkline_grid_plot(title, labels, dates, y_mat, out_path,
+                        sort='growth', ncols=SPARK_COLS):
+    """
+    Draw a sparkline of every row of y_mat into a single grid image.
+
+    All sparklines are drawn by one LineCollection and the labels by one
+    text per grid column on one axis, so this stays fast for thousands of
+    regions. Rasterizing label glyphs remains the costliest part.
+
+    title    - String indicating title for entire figure.
+    labels   - Label for each row of y_mat (e.g. region names), or None to
+               draw no labels, which is much faster for thousands of rows
+    dates    - List of dates of data (columns of y_mat)
+    y_mat    - (regions x days) numpy array of values to plot
+    out_path - Path of the image file to write
+    sort     - One of the following options:
+                * 'growth' - Fastest recent growth first
+                * 'name'   - Order of labels
+    ncols    - Number of sparklines per grid row
+
+    Returns: None
+    """
+
+    y_mat = np.asarray(y_mat, dtype=np.float64)
+    n_regions, n_days = y_mat.shape
+    growth = recent_growth(y_mat)
+
+    if sort == 'growth':
+        order = np.argsort(-growth, kind='stable')
+    else:
+        order = np.arange(n_regions)
+
+    y_mat = y_mat[order]
+    growth = growth[order]
+    if labels is not None:
+        labels = [labels[i] for i in order]
+
+    # Scale each sparkline to [0, 1] of its own cell
+    peaks = y_mat.max(axis=1, keepdims=True)
+    y_norm = y_mat / np.where(peaks > 0, peaks, 1.)
+
+    cells = np.arange(n_regions)
+    x_off = (cells % ncols) * (1. + SPARK_GAP)
+    y_off = -(cells // ncols) * (1. + SPARK_GAP)
+
+    segments = np.empty((n_regions, n_days, 2))
+    segments[:, :, 0] = np.linspace(0., 1., n_days)[np.newaxis, :] + x_off[:, np.newaxis]
+    segments[:, :, 1] = y_norm * (1. - SPARK_GAP) + y_off[:, np.newaxis]
+
+    # Red for growing regions, green for shrinking regions. The scale is
+    # set by a percentile so a few outliers don't wash out every other color
+    limit = max(np.percentile(np.abs(growth), SPARK_GROWTH_PERCENTILE), 1e-9)
+    colors = plt.get_cmap('RdYlGn_r')(0.5 + 0.5 * np.clip(growth / limit, -1., 1.))
+
+    n_rows = (n_regions + ncols - 1) // ncols
+    fig, axis = plt.subplots(figsize=(ncols * SPARK_CELL_SIZE[0],
+                                      n_rows * SPARK_CELL_SIZE[1] + 1))
+
+    axis.add_collection(LineCollection(segments, colors=colors, linewidths=0.6))
+
+    axis.set_xlim(-SPARK_GAP, ncols * (1. + SPARK_GAP))
+    axis.set_ylim(-n_rows * (1. + SPARK_GAP) + 1., 1. + SPARK_GAP)
+    axis.set_axis_off()
+
+    if labels is not None:
+        draw_sparkline_labels(fig, axis, labels, ncols)
+
+    fig.suptitle(title + " (" + dates[0] + " - " + dates[-1] + ")",
+                 fontsize=FIGURE_TITLE_FONTSIZE)
+    fig.savefig(out_path, dpi=SPARK_DPI)
+    plt.close(fig)
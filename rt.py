@@ -0,0 +1,100 @@
+"""
+Reproduction number (Rt) estimation for many regions at once.
+
+Implements the serial-interval based estimator of Cori et al. (2013): with
+daily incidence I_t and a discretized serial interval w_s, the total
+infectiousness is Lambda_t = sum_s I_{t-s} w_s. Over a trailing window of
+RT_WINDOW days, a Gamma(a, b) prior on Rt gives the posterior
+
+    Rt ~ Gamma(a + sum I, 1 / (1/b + sum Lambda))
+
+Every function operates along the last axis, so passing a (regions x days)
+array estimates Rt for all regions without looping over them.
+"""
+
+import numpy as np
+from scipy.signal import lfilter
+from scipy.stats import gamma
+
+from data_utils import window_sums
+
+
+# Serial interval parameters (days)
+SI_MEAN = 4.7
+SI_SD = 2.9
+SI_MAX_DAYS = 21
+
+# Estimation parameters
+RT_WINDOW = 7
+RT_CI = 0.95
+PRIOR_SHAPE = 1.
+PRIOR_SCALE = 5.
+
+# Windows with less total infectiousness than this are left undefined (NaN)
+MIN_INFECTIOUSNESS = 10.
+
+
+def serial_interval(mean=SI_MEAN, sd=SI_SD, max_days=SI_MAX_DAYS):
+    """
+    Discretized gamma serial interval distribution.
+
+    Returns: Numpy array w of length max_days, where w[s-1] is the
+             probability of a serial interval of s days.
+    """
+
+    days = np.arange(1, max_days + 1)
+    dist = gamma(a=(mean / sd) ** 2, scale=sd ** 2 / mean)
+    weights = dist.cdf(days + 0.5) - dist.cdf(days - 0.5)
+
+    return weights / weights.sum()
+
+
+def trailing_sum(y_mat, window):
+    """
+    Sum of the trailing window days along the last axis. The first
+    window-1 days, which lack a full window, are NaN.
+    """
+
+    sums = np.full(y_mat.shape, np.nan)
+    sums[..., window-1:] = window_sums(y_mat, window)
+
+    return sums
+
+
+def estimate_rt(daily_cases, window=RT_WINDOW, ci=RT_CI, si_weights=None):
+    """
+    Estimate Rt for each day of each region.
+
+    daily_cases - Numpy array of daily new cases, either 1-D (days) or
+                  2-D (regions x days)
+    window      - Number of trailing days each estimate is based on
+    ci          - Width of the credible interval (e.g. 0.95)
+    si_weights  - Serial interval distribution; defaults to serial_interval()
+
+    Returns: (r_mean, r_low, r_high), each the shape of daily_cases.
+             Days without enough data are NaN.
+    """
+
+    cases = np.nan_to_num(np.asarray(daily_cases, dtype=np.float64))
+    cases = np.clip(cases, 0, None)
+
+    if si_weights is None:
+        si_weights = serial_interval()
+
+    # Lambda_t = sum_{s>=1} I_{t-s} w_s, as a causal filter over all rows
+    infectiousness = lfilter(np.concatenate(([0.], si_weights)), [1.], cases, axis=-1)
+
+    case_sums = trailing_sum(cases, window)
+    infectiousness_sums = trailing_sum(infectiousness, window)
+
+    valid = infectiousness_sums >= MIN_INFECTIOUSNESS
+    infectiousness_sums = np.where(valid, infectiousness_sums, np.nan)
+
+    shape = PRIOR_SHAPE + case_sums
+    scale = 1. / (1. / PRIOR_SCALE + infectiousness_sums)
+
+    r_mean = shape * scale
+    r_low = gamma.ppf((1. - ci) / 2., shape, scale=scale)
+    r_high = gamma.ppf((1. + ci) / 2., shape, scale=scale)
+
+    return r_mean, r_low, r_high
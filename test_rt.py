@@ -0,0 +1,63 @@
+"""
+Tests for the Rt estimator.
+"""
+
+import numpy as np
+
+from rt import estimate_rt, serial_interval, SI_MAX_DAYS, RT_WINDOW, \
+        MIN_INFECTIOUSNESS
+
+
+def growth_series(rate, days=120, start=1000.):
+    """ Daily cases growing at a constant exponential rate. """
+
+    return start * np.exp(rate * np.arange(days))
+
+
+def test_constant_growth_recovers_r():
+    """ Constant growth rate r implies R = 1 / sum_s w_s exp(-r s). """
+
+    rate = 0.05
+    weights = serial_interval()
+    expected = 1. / np.sum(weights * np.exp(-rate * np.arange(1, SI_MAX_DAYS + 1)))
+
+    r_mean, r_low, r_high = estimate_rt(growth_series(rate))
+
+    # Once the full serial interval is observed, Lambda_t is exact
+    tail = slice(SI_MAX_DAYS + 1, None)
+    np.testing.assert_allclose(r_mean[tail], expected, rtol=1e-3)
+    assert np.all(r_low[tail] <= expected)
+    assert np.all(r_high[tail] >= expected)
+
+    # Days before the first full window are undefined
+    assert np.all(np.isnan(r_mean[:RT_WINDOW - 1]))
+
+
+def test_rows_match_1d():
+    """ Each row of a 2-D input gives the same estimate as the 1-D input. """
+
+    cases = np.stack([growth_series(0.05), growth_series(-0.03), growth_series(0.)])
+
+    r_mat = estimate_rt(cases)
+
+    for i, row in enumerate(cases):
+        for r_row, r_1d in zip(r_mat, estimate_rt(row)):
+            np.testing.assert_allclose(r_row[i], r_1d)
+
+
+def test_low_infectiousness_is_nan():
+    """ Windows with too little total infectiousness are left undefined. """
+
+    cases = np.zeros((2, 60))
+    # One small outbreak whose infectiousness stays below the threshold
+    cases[1, 10] = MIN_INFECTIOUSNESS / 2.
+
+    r_mean, r_low, r_high = estimate_rt(cases)
+
+    assert np.all(np.isnan(r_mean))
+    assert np.all(np.isnan(r_low))
+    assert np.all(np.isnan(r_high))
+
+    # The same outbreak scaled up is estimated once infectiousness suffices
+    r_mean, _, _ = estimate_rt(cases[1] * 100.)
+    assert np.any(np.isfinite(r_mean[11:]))